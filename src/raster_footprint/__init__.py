@@ -1,19 +1,24 @@
-from .densify import (
-    densify_by_distance,
-    densify_by_factor,
-    densify_geometry,
-    densify_multipolygon,
-    densify_polygon,
-)
-from .footprint import (
-    footprint_from_data,
-    footprint_from_href,
-    footprint_from_mask,
-    footprint_from_rasterio_reader,
-)
-from .mask import create_mask, get_mask_geometry
-from .reproject import reproject_geometry
-from .simplify import simplify_geometry
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .densify import (
+        densify_by_distance,
+        densify_by_factor,
+        densify_geometry,
+        densify_multipolygon,
+        densify_polygon,
+    )
+    from .footprint import (
+        footprint_from_data,
+        footprint_from_href,
+        footprint_from_mask,
+        footprint_from_rasterio_reader,
+        footprints_from_hrefs,
+    )
+    from .mask import create_mask, get_mask_geometry
+    from .reproject import reproject_geometry
+    from .simplify import simplify_geometry
 
 __all__ = [
     "densify_by_distance",
@@ -25,8 +30,47 @@ __all__ = [
     "footprint_from_href",
     "footprint_from_mask",
     "footprint_from_rasterio_reader",
+    "footprints_from_hrefs",
     "create_mask",
     "get_mask_geometry",
     "reproject_geometry",
     "simplify_geometry",
 ]
+
+# The public functions are imported on first access so that importing the
+# package (e.g., for ``raster-footprint --help``) does not load rasterio and
+# shapely until they are needed.
+_SUBMODULES = {
+    "densify_by_distance": "densify",
+    "densify_by_factor": "densify",
+    "densify_geometry": "densify",
+    "densify_multipolygon": "densify",
+    "densify_polygon": "densify",
+    "footprint_from_data": "footprint",
+    "footprint_from_href": "footprint",
+    "footprint_from_mask": "footprint",
+    "footprint_from_rasterio_reader": "footprint",
+    "footprints_from_hrefs": "footprint",
+    "create_mask": "mask",
+    "get_mask_geometry": "mask",
+    "reproject_geometry": "reproject",
+    "simplify_geometry": "simplify",
+}
+_MODULES = {"constants", "densify", "footprint", "mask", "reproject", "simplify"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{_SUBMODULES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _MODULES:
+        # submodules remain accessible as attributes of the package, as they
+        # were when the package imported them eagerly
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return [*__all__, *sorted(_MODULES)]
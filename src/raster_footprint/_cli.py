@@ -7,14 +7,8 @@ import os
 import sys
 from typing import Optional
 
-from shapely.geometry import mapping, shape
-
-from raster_footprint import (
-    densify_geometry,
-    footprint_from_href,
-    reproject_geometry,
-    simplify_geometry,
-)
+# Geospatial dependencies are imported inside each command so that argument
+# parsing and ``--help`` do not pay for loading GDAL, PROJ, and GEOS.
 
 
 def output(footprint, outfile: Optional[str] = None):
@@ -25,10 +19,13 @@ def output(footprint, outfile: Optional[str] = None):
         with open(outfile, "w") as f:
             json.dump(footprint, f, indent=4)
     else:
-        print(json.dumps(footprint, indent=4))
+        json.dump(footprint, sys.stdout, indent=4)
+        sys.stdout.write("\n")
 
 
 def create(args) -> None:
+    from raster_footprint import footprint_from_href
+
     href = args.pop("infile")
     outfile = args.pop("outfile", None)
 
@@ -37,33 +34,48 @@ def create(args) -> None:
 
 
 def densify(args) -> None:
+    from shapely import from_geojson
+    from shapely.geometry import mapping
+
+    from raster_footprint import densify_geometry
+
     infile = args.pop("infile")
     outfile = args.pop("outfile", None)
 
-    with open(infile, "r") as f:
-        geometry = shape(json.load(f))
+    with open(infile, "rb") as f:
+        geometry = from_geojson(f.read())
 
     densified = mapping(densify_geometry(geometry, **args))
     output(densified, outfile)
 
 
 def reproject(args) -> None:
+    from shapely import from_geojson
+    from shapely.geometry import mapping
+
+    from raster_footprint import reproject_geometry
+
     infile = args.pop("infile")
     outfile = args.pop("outfile", None)
 
-    with open(infile, "r") as f:
-        geometry = shape(json.load(f))
+    with open(infile, "rb") as f:
+        geometry = from_geojson(f.read())
 
     reprojected = mapping(reproject_geometry(geometry, **args))
     output(reprojected, outfile)
 
 
 def simplify(args) -> None:
+    from shapely import from_geojson
+    from shapely.geometry import mapping
+
+    from raster_footprint import simplify_geometry
+
     infile = args.pop("infile")
     outfile = args.pop("outfile", None)
 
-    with open(infile, "r") as f:
-        geometry = shape(json.load(f))
+    with open(infile, "rb") as f:
+        geometry = from_geojson(f.read())
 
     simplified = mapping(simplify_geometry(geometry, **args))
     output(simplified, outfile)
@@ -90,6 +102,7 @@ def cli() -> None:
     parser_create.add_argument("--simplify-tolerance", type=float, help="Simplification tolerance")
     parser_create.add_argument("--convex-hull", action="store_true", help="Apply convex hull to footprint")
     parser_create.add_argument("--holes", action="store_true", help="Include polygon holes in footprint")
+    parser_create.add_argument("--downsample", type=int, help="Mask downsampling factor")
     parser_create.add_argument("--bands", nargs="+", type=int, help="Raster band indices to include in footprint")
     parser_create.add_argument("--with-nodata", action="store_true", help="Include nodata pixels in the footprint")
 
@@ -121,7 +134,6 @@ def cli() -> None:
     parser_simplify.add_argument("--outfile", help="Output footprint filename")
     parser_simplify.add_argument("--tolerance", type=float, help="Simplification tolerance")
 
-    parser.parse_args(sys.argv[1:] or ["--help"])
     args = vars(parser.parse_args(sys.argv[1:] or ["--help"]))
     func = args.pop("func")
     args = {k: v for k, v in args.items() if v is not None}
@@ -1,8 +1,11 @@
 from typing import TypeVar
 
+from rasterio.crs import CRS
 from shapely.geometry.multipolygon import MultiPolygon
 from shapely.geometry.polygon import Polygon
 
 T = TypeVar("T", Polygon, MultiPolygon)
 
 DEFAULT_PRECISION = 7
+
+DEFAULT_DESTINATION_CRS = CRS.from_epsg(4326)
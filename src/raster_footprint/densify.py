@@ -1,6 +1,8 @@
-from typing import Any, List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
+from numpy import typing as npt
+from shapely import get_coordinates, get_parts, get_rings, linearrings, polygons
 from shapely.geometry.multipolygon import MultiPolygon
 from shapely.geometry.polygon import Polygon
 
@@ -8,7 +10,7 @@ from .constants import DEFAULT_PRECISION, T
 
 
 def densify_by_factor(
-    point_list: List[Tuple[float, float]],
+    point_list: Union[List[Tuple[float, float]], npt.NDArray[np.float64]],
     factor: int,
     *,
     precision: int = DEFAULT_PRECISION,
@@ -24,8 +26,9 @@ def densify_by_factor(
     https://stackoverflow.com/questions/64995977/generating-equidistance-points-along-the-boundary-of-a-polygon-but-cw-ccw
 
     Args:
-        point_list (List[Tuple[float, float]]): The list of points to be
-            densified.
+        point_list (Union[List[Tuple[float, float]], NDArray[float64]]): The
+            list of points to be densified, or an equivalent (N, 2) NumPy
+            array.
         factor (int): The factor by which to densify the points.
         precision (Optional[int]): The number of decimal places to include in
             the point coordinates. Defaults to 7.
@@ -33,21 +36,15 @@ def densify_by_factor(
     Returns:
         List[Tuple[float, float]]: The densified point list.
     """
-    points: Any = np.asarray(point_list)
-    densified_number = len(points) * factor
-    existing_indices = np.arange(0, densified_number, factor)
-    interp_indices = np.arange(existing_indices[-1] + 1)
-    interp_x = np.round(
-        np.interp(interp_indices, existing_indices, points[:, 0]), decimals=precision
+    points = np.asarray(point_list, dtype=np.float64)
+    densified_array, _ = _densify_points_by_factor(
+        points, np.zeros(len(points), dtype=np.intp), factor, precision
     )
-    interp_y = np.round(
-        np.interp(interp_indices, existing_indices, points[:, 1]), decimals=precision
-    )
-    return [(x, y) for x, y in zip(interp_x, interp_y)]
+    return list(map(tuple, densified_array.tolist()))
 
 
 def densify_by_distance(
-    point_list: List[Tuple[float, float]],
+    point_list: Union[List[Tuple[float, float]], npt.NDArray[np.float64]],
     distance: float,
     *,
     precision: int = DEFAULT_PRECISION,
@@ -64,8 +61,9 @@ def densify_by_distance(
     https://stackoverflow.com/questions/64995977/generating-equidistance-points-along-the-boundary-of-a-polygon-but-cw-ccw
 
     Args:
-        point_list (List[Tuple[float, float]]): The list of points to be
-            densified.
+        point_list (Union[List[Tuple[float, float]], NDArray[float64]]): The
+            list of points to be densified, or an equivalent (N, 2) NumPy
+            array.
         distance (float): The interval at which to insert additional points.
         precision (Optional[int]): The number of decimal places to include in
             the point coordinates. Defaults to 7.
@@ -73,22 +71,11 @@ def densify_by_distance(
     Returns:
         List[Tuple[float, float]]: The densified point list.
     """
-    points: Any = np.asarray(point_list)
-    dxdy = points[1:, :] - points[:-1, :]
-    segment_lengths = np.sqrt(np.sum(np.square(dxdy), axis=1))
-    steps = segment_lengths / distance
-    coordinate_steps = dxdy / steps.reshape(-1, 1)
-    densified_points = np.empty((len(point_list) - 1,), dtype="O")
-    for index in range(len(point_list) - 1):
-        step = np.arange(steps[index])
-        densified_points[index] = (
-            np.array((step, step)).T * coordinate_steps[index] + points[index]
-        )
-    final_point = points[-1].reshape(1, -1)
-    densified_array = np.round(
-        np.concatenate((*densified_points, final_point), axis=0), decimals=precision
+    points = np.asarray(point_list, dtype=np.float64)
+    densified_array, _ = _densify_points_by_distance(
+        points, np.zeros(len(points), dtype=np.intp), distance, precision
     )
-    return [(float(row[0]), float(row[1])) for row in densified_array]
+    return list(map(tuple, densified_array.tolist()))
 
 
 def densify_polygon(
@@ -120,24 +107,16 @@ def densify_polygon(
     """
     if factor is not None and distance is not None:
         raise ValueError("Only one of 'factor' or 'distance' can be specified.")
-    if factor is not None:
-        shell = densify_by_factor(polygon.exterior.coords, factor, precision=precision)
-        holes = [
-            densify_by_factor(interior.coords, factor, precision=precision)
-            for interior in polygon.interiors
-        ]
-        return Polygon(shell=shell, holes=holes)
-    elif distance is not None:
-        shell = densify_by_distance(
-            polygon.exterior.coords, distance, precision=precision
-        )
-        holes = [
-            densify_by_distance(interior.coords, distance, precision=precision)
-            for interior in polygon.interiors
-        ]
-        return Polygon(shell=shell, holes=holes)
-    else:
+    if factor is None and distance is None:
+        return polygon
+
+    rings = get_rings(polygon)
+    densified_rings = _densify_rings(
+        rings, factor=factor, distance=distance, precision=precision
+    )
+    if densified_rings is rings:
         return polygon
+    return Polygon(shell=densified_rings[0], holes=densified_rings[1:])
 
 
 def densify_multipolygon(
@@ -167,11 +146,18 @@ def densify_multipolygon(
     Returns:
         MultiPolygon: The densified multipolygon.
     """
-    densified_polygons = [
-        densify_polygon(polygon, factor=factor, distance=distance, precision=precision)
-        for polygon in multipolygon.geoms
-    ]
-    return MultiPolygon(densified_polygons)
+    if factor is not None and distance is not None:
+        raise ValueError("Only one of 'factor' or 'distance' can be specified.")
+    if factor is None and distance is None:
+        return multipolygon
+
+    rings, polygon_indices = get_rings(get_parts(multipolygon), return_index=True)
+    densified_rings = _densify_rings(
+        rings, factor=factor, distance=distance, precision=precision
+    )
+    if densified_rings is rings:
+        return multipolygon
+    return MultiPolygon(list(polygons(densified_rings, indices=polygon_indices)))
 
 
 def densify_geometry(
@@ -208,3 +194,112 @@ def densify_geometry(
         )
     else:
         raise TypeError("geometry must be a Polygon or MultiPolygon")
+
+
+def _densify_rings(
+    rings: npt.NDArray[np.object_],
+    *,
+    factor: Optional[int],
+    distance: Optional[float],
+    precision: int,
+) -> npt.NDArray[np.object_]:
+    """Densifies an array of linear rings with a single pass over their
+    combined coordinates, and builds the new rings with one GEOS call.
+
+    The input ``rings`` array is returned as-is if densification would not
+    change any coordinates.
+    """
+    points, ring_indices = get_coordinates(rings, return_index=True)
+    if factor is not None:
+        densified, densified_ring_indices = _densify_points_by_factor(
+            points, ring_indices, factor, precision
+        )
+    elif distance is not None:
+        densified, densified_ring_indices = _densify_points_by_distance(
+            points, ring_indices, distance, precision
+        )
+    else:
+        return rings
+    if np.array_equal(densified, points):
+        return rings
+    densified_rings: npt.NDArray[np.object_] = linearrings(
+        densified, indices=densified_ring_indices
+    )
+    return densified_rings
+
+
+def _densify_points_by_factor(
+    points: npt.NDArray[np.float64],
+    ring_indices: npt.NDArray[np.intp],
+    factor: int,
+    precision: int,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.intp]]:
+    if factor == 1:
+        return np.round(points, decimals=precision), ring_indices
+
+    ring_ends = _ring_ends(ring_indices)
+    dxdy = _segment_deltas(points, ring_ends)
+    counts = np.where(ring_ends, 1, factor)
+    point_indices, step = _expand(counts)
+    densified = dxdy[point_indices]
+    densified *= (step / factor).reshape(-1, 1)
+    densified += points[point_indices]
+    np.round(densified, decimals=precision, out=densified)
+    return densified, ring_indices[point_indices]
+
+
+def _densify_points_by_distance(
+    points: npt.NDArray[np.float64],
+    ring_indices: npt.NDArray[np.intp],
+    distance: float,
+    precision: int,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.intp]]:
+    ring_ends = _ring_ends(ring_indices)
+    dxdy = _segment_deltas(points, ring_ends)
+    segment_lengths = np.sqrt(np.sum(np.square(dxdy), axis=1))
+    steps = segment_lengths / distance
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coordinate_steps = dxdy / steps.reshape(-1, 1)
+    coordinate_steps[ring_ends] = 0
+
+    # Each segment contributes ceil(steps) points (its start point plus the
+    # inserted points); the last point of each ring contributes itself.
+    counts = np.ceil(steps).astype(np.int64)
+    counts[ring_ends] = 1
+    if np.all(counts == 1):
+        return np.round(points, decimals=precision), ring_indices
+
+    point_indices, step = _expand(counts)
+    densified = coordinate_steps[point_indices]
+    densified *= step.reshape(-1, 1)
+    densified += points[point_indices]
+    np.round(densified, decimals=precision, out=densified)
+    return densified, ring_indices[point_indices]
+
+
+def _ring_ends(ring_indices: npt.NDArray[np.intp]) -> npt.NDArray[np.bool_]:
+    """Flags the last point of each ring in a flat, ring-sorted point array."""
+    ring_ends = np.ones(len(ring_indices), dtype=bool)
+    ring_ends[:-1] = ring_indices[1:] != ring_indices[:-1]
+    return ring_ends
+
+
+def _segment_deltas(
+    points: npt.NDArray[np.float64], ring_ends: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.float64]:
+    """Returns the offset from each point to the next point in its ring; the
+    offset is zero for the last point of each ring."""
+    dxdy = np.zeros_like(points)
+    dxdy[:-1] = points[1:] - points[:-1]
+    dxdy[ring_ends] = 0
+    return dxdy
+
+
+def _expand(
+    counts: npt.NDArray[np.int64],
+) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.int64]]:
+    """Repeats each point index ``counts`` times and numbers the repeats."""
+    point_indices = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.cumsum(counts) - counts
+    step = np.arange(len(point_indices)) - offsets[point_indices]
+    return point_indices, step
@@ -1,32 +1,63 @@
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import rasterio
 from numpy import typing as npt
 from rasterio import Affine
 from rasterio.crs import CRS
+from rasterio.enums import MaskFlags
 from rasterio.io import DatasetReader
+from rasterio.windows import Window
 from shapely.geometry import mapping
+from shapely.geometry.multipolygon import MultiPolygon
+from shapely.geometry.polygon import Polygon
 
-from .constants import DEFAULT_PRECISION
+from .constants import DEFAULT_DESTINATION_CRS, DEFAULT_PRECISION
 from .densify import densify_geometry
-from .mask import create_mask, get_mask_geometry
+from .mask import (
+    _accumulate_valid,
+    _can_equal,
+    _convex_hull_of_rows,
+    _get_extent_geometry,
+    _row_extents,
+    _set_valid,
+    _to_mask,
+    create_mask,
+    get_mask_geometry,
+)
 from .reproject import reproject_geometry
 from .simplify import simplify_geometry
 
+# The approximate number of pixels per band read at a time when computing a
+# mask from a dataset.
+_STRIP_PIXELS = 2**22
+
 
 def footprint_from_mask(
     mask: npt.NDArray[np.uint8],
     transform: Affine,
     source_crs: CRS,
     *,
-    destination_crs: CRS = CRS.from_epsg(4326),
+    destination_crs: CRS = DEFAULT_DESTINATION_CRS,
     precision: int = DEFAULT_PRECISION,
     densify_factor: Optional[int] = None,
     densify_distance: Optional[float] = None,
     simplify_tolerance: Optional[float] = None,
     convex_hull: bool = False,
     holes: bool = False,
+    downsample: Optional[int] = None,
 ) -> Optional[Dict[str, Any]]:
     """Produces a GeoJSON dictionary containing a polygon or multipolygon geometry
     surrounding valid data locations in the given ``mask`` array.
@@ -67,27 +98,38 @@ def footprint_from_mask(
             simplification. Defaults to False.
         holes (bool): Whether to include holes in the created polygons. Has
             no effect if ``convex_hull`` is True. Defaults to False.
+        downsample (Optional[int]): The factor by which to reduce the mask
+            resolution before creating polygons. A reduced pixel is valid if
+            any of the pixels it covers is valid, which is much faster for
+            large rasters at the cost of footprint edges that may extend up
+            to ``downsample - 1`` pixels beyond the valid data. Has no effect
+            if every pixel is valid, in which case the footprint is the exact
+            raster extent. Defaults to ``None``.
 
     Returns:
         Optional[Dict[str, Any]]: A GeoJSON dictionary containing the
         footprint polygon or multipolygon.
     """
     geometry = get_mask_geometry(
-        mask, transform=transform, convex_hull=convex_hull, holes=holes
+        mask,
+        transform=transform,
+        convex_hull=convex_hull,
+        holes=holes,
+        downsample=downsample,
     )
 
     if geometry is None:
         return None
 
-    densified = densify_geometry(
-        geometry, factor=densify_factor, distance=densify_distance
-    )
-    reprojected = reproject_geometry(
-        densified, source_crs, destination_crs, precision=precision
+    return _footprint_from_geometry(
+        geometry,
+        source_crs,
+        destination_crs=destination_crs,
+        precision=precision,
+        densify_factor=densify_factor,
+        densify_distance=densify_distance,
+        simplify_tolerance=simplify_tolerance,
     )
-    simplified = simplify_geometry(reprojected, tolerance=simplify_tolerance)
-
-    return mapping(simplified)
 
 
 def footprint_from_data(
@@ -95,7 +137,7 @@ def footprint_from_data(
     transform: Affine,
     source_crs: CRS,
     *,
-    destination_crs: CRS = CRS.from_epsg(4326),
+    destination_crs: CRS = DEFAULT_DESTINATION_CRS,
     nodata: Optional[Union[int, float]] = None,
     precision: int = DEFAULT_PRECISION,
     densify_factor: Optional[int] = None,
@@ -103,6 +145,7 @@ def footprint_from_data(
     simplify_tolerance: Optional[float] = None,
     convex_hull: bool = False,
     holes: bool = False,
+    downsample: Optional[int] = None,
 ) -> Optional[Dict[str, Any]]:
     """Produces a GeoJSON dictionary containing a polygon or multipolygon
     surrounding valid data locations in the given ``data`` array.
@@ -138,6 +181,13 @@ def footprint_from_data(
             simplification. Defaults to False.
         holes (bool): Whether to include holes in the created polygons. Has
             no effect if ``convex_hull`` is True. Defaults to False.
+        downsample (Optional[int]): The factor by which to reduce the mask
+            resolution before creating polygons. A reduced pixel is valid if
+            any of the pixels it covers is valid, which is much faster for
+            large rasters at the cost of footprint edges that may extend up
+            to ``downsample - 1`` pixels beyond the valid data. Has no effect
+            if every pixel is valid, in which case the footprint is the exact
+            raster extent. Defaults to ``None``.
 
     Returns:
         Optional[Dict[str, Any]]: A GeoJSON dictionary containing the
@@ -155,13 +205,14 @@ def footprint_from_data(
         simplify_tolerance=simplify_tolerance,
         convex_hull=convex_hull,
         holes=holes,
+        downsample=downsample,
     )
 
 
 def footprint_from_href(
     href: str,
     *,
-    destination_crs: CRS = CRS.from_epsg(4326),
+    destination_crs: CRS = DEFAULT_DESTINATION_CRS,
     nodata: Optional[Union[int, float]] = None,
     precision: int = DEFAULT_PRECISION,
     densify_factor: Optional[int] = None,
@@ -169,6 +220,7 @@ def footprint_from_href(
     simplify_tolerance: Optional[float] = None,
     convex_hull: bool = False,
     holes: bool = False,
+    downsample: Optional[int] = None,
     bands: Optional[List[int]] = None,
     with_nodata: bool = False,
 ) -> Optional[Dict[str, Any]]:
@@ -208,6 +260,13 @@ def footprint_from_href(
             simplification. Defaults to False.
         holes (bool): Whether to include holes in the created polygons. Has
             no effect if ``convex_hull`` is True. Defaults to False.
+        downsample (Optional[int]): The factor by which to reduce the mask
+            resolution before creating polygons. A reduced pixel is valid if
+            any of the pixels it covers is valid, which is much faster for
+            large rasters at the cost of footprint edges that may extend up
+            to ``downsample - 1`` pixels beyond the valid data. Has no effect
+            if every pixel is valid, in which case the footprint is the exact
+            raster extent. Defaults to ``None``.
         with_nodata (bool): If True, a footprint for the entire raster,
             including nodata pixels, is returned. Defaults to False.
         bands (List[int]): The bands to use to compute the footprint.
@@ -232,13 +291,119 @@ def footprint_from_href(
             bands=bands,
             convex_hull=convex_hull,
             holes=holes,
+            downsample=downsample,
         )
 
 
+def footprints_from_hrefs(
+    hrefs: Iterable[str],
+    *,
+    destination_crs: CRS = DEFAULT_DESTINATION_CRS,
+    nodata: Optional[Union[int, float]] = None,
+    precision: int = DEFAULT_PRECISION,
+    densify_factor: Optional[int] = None,
+    densify_distance: Optional[float] = None,
+    simplify_tolerance: Optional[float] = None,
+    convex_hull: bool = False,
+    holes: bool = False,
+    downsample: Optional[int] = None,
+    bands: Optional[List[int]] = None,
+    with_nodata: bool = False,
+    max_workers: Optional[int] = None,
+    use_threads: bool = False,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> List[Optional[Dict[str, Any]]]:
+    """Produces GeoJSON footprint dictionaries for many raster files in parallel.
+
+    Each href is processed by :func:`footprint_from_href` in a separate worker
+    process, or in a separate thread if ``use_threads`` is True. Results are
+    returned in the same order as ``hrefs``.
+
+    Workers inherit the parent environment, so GDAL and PROJ configuration
+    (e.g., ``GDAL_CACHEMAX`` or ``PROJ_NETWORK``) set through environment
+    variables applies to every worker. Per-worker setup can be done once with
+    ``initializer`` and ``initargs``.
+
+    Threads avoid the cost of starting processes and of pickling results, and
+    share GDAL's block cache. GDAL, GEOS, and most NumPy operations release
+    the GIL, so threads work well when reading is the bottleneck, e.g., for
+    remote hrefs.
+
+    Args:
+        hrefs (Iterable[str]): Hrefs to raster data files.
+        destination_crs (CRS): A :class:`rasterio.crs.CRS` object defining the
+            desired coordinate reference system of output footprints. Defaults
+            to EPSG:4326 (WGS84).
+        nodata (Optional[Union[int, float]]): Explicitly sets the nodata value
+            to use for creating data/nodata mask arrays. If not provided, the
+            nodata value in each source file's metadata is used.
+        precision (Optional[int]): The number of decimal places to include in
+            the final footprint polygon vertex coordinates. Defaults to 7.
+        densify_factor (Optional[int]): The factor by which to increase the
+            number of polygon vertices. Mutually exclusive with
+            ``densify_distance``. Defaults to ``None``.
+        densify_distance (Optional[float]): The interval at which to insert
+            additional polygon vertices. Mutually exclusive with
+            ``densify_factor``. Defaults to ``None``.
+        simplify_tolerance (Optional[float]): The maximum distance between
+            original polygon vertices and the simplified polygon(s). Unit is
+            geographic decimal degrees. Defaults to ``None``.
+        convex_hull (bool): Whether to compute the convex hull of any created
+            polygons. Defaults to False.
+        holes (bool): Whether to include holes in the created polygons. Has
+            no effect if ``convex_hull`` is True. Defaults to False.
+        downsample (Optional[int]): The factor by which to reduce the mask
+            resolution before creating polygons. A reduced pixel is valid if
+            any of the pixels it covers is valid, which is much faster for
+            large rasters at the cost of footprint edges that may extend up
+            to ``downsample - 1`` pixels beyond the valid data. Has no effect
+            if every pixel is valid, in which case the footprint is the exact
+            raster extent. Defaults to ``None``.
+        bands (List[int]): The bands to use to compute the footprints.
+            Defaults to [1].
+        with_nodata (bool): If True, footprints for the entire rasters,
+            including nodata pixels, are returned. Defaults to False.
+        max_workers (Optional[int]): The maximum number of worker processes or
+            threads. Defaults to the number of processors on the machine for
+            processes and to the default of
+            :class:`concurrent.futures.ThreadPoolExecutor` for threads.
+        use_threads (bool): Whether to use worker threads instead of worker
+            processes. Defaults to False.
+        initializer (Optional[Callable[..., None]]): A callable run once in
+            each worker when it starts. Defaults to ``None``.
+        initargs (Tuple[Any, ...]): Arguments passed to ``initializer``.
+
+    Returns:
+        List[Optional[Dict[str, Any]]]: A GeoJSON dictionary containing the
+        footprint polygon or multipolygon for each href.
+    """
+    footprint = partial(
+        footprint_from_href,
+        destination_crs=destination_crs,
+        nodata=nodata,
+        precision=precision,
+        densify_factor=densify_factor,
+        densify_distance=densify_distance,
+        simplify_tolerance=simplify_tolerance,
+        convex_hull=convex_hull,
+        holes=holes,
+        downsample=downsample,
+        bands=bands,
+        with_nodata=with_nodata,
+    )
+    executor_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    executor: Executor
+    with executor_class(
+        max_workers=max_workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        return list(executor.map(footprint, hrefs))
+
+
 def footprint_from_rasterio_reader(
     reader: DatasetReader,
     *,
-    destination_crs: CRS = CRS.from_epsg(4326),
+    destination_crs: CRS = DEFAULT_DESTINATION_CRS,
     nodata: Optional[Union[int, float]] = None,
     precision: int = DEFAULT_PRECISION,
     densify_factor: Optional[int] = None,
@@ -246,8 +411,10 @@ def footprint_from_rasterio_reader(
     simplify_tolerance: Optional[float] = None,
     convex_hull: bool = False,
     holes: bool = False,
+    downsample: Optional[int] = None,
     bands: Optional[List[int]] = None,
     with_nodata: bool = False,
+    out: Optional[npt.NDArray[np.uint8]] = None,
 ) -> Optional[Dict[str, Any]]:
     """Produces a GeoJSON dictionary containing a polygon or multipolygon
     surrounding valid data locations from a :class:`rasterio.io.DatasetReader`
@@ -283,12 +450,26 @@ def footprint_from_rasterio_reader(
             simplification. Defaults to False.
         holes (bool): Whether to include holes in the created polygons. Has
             no effect if ``convex_hull`` is True. Defaults to False.
+        downsample (Optional[int]): The factor by which to reduce the mask
+            resolution before creating polygons. A reduced pixel is valid if
+            any of the pixels it covers is valid, which is much faster for
+            large rasters at the cost of footprint edges that may extend up
+            to ``downsample - 1`` pixels beyond the valid data. Has no effect
+            if every pixel is valid, in which case the footprint is the exact
+            raster extent. Defaults to ``None``.
         with_nodata (bool): If True, a footprint for the entire raster,
             including nodata pixels, is returned. Defaults to False.
         bands (List[int]): The bands to use to compute the footprint.
             Defaults to [1]. If an empty list is provided, the bands will be
             ORd together; e.g., for a pixel to be outside of the footprint,
             all bands must have nodata in that pixel.
+        out (Optional[NDArray[uint8]]): A preallocated, C-contiguous uint8
+            array of shape ``(height, width)`` to read the union of the band
+            masks, or of the pixels not matching ``nodata``, into. Its
+            contents are overwritten. Allows a caller computing footprints
+            for many same-sized rasters to reuse one buffer. Not used when
+            the footprint is the raster extent or, without ``downsample``,
+            a convex hull. Defaults to ``None``.
 
     Returns:
         Optional[Dict[str, Any]]: A GeoJSON dictionary containing the
@@ -298,30 +479,60 @@ def footprint_from_rasterio_reader(
         raise ValueError(
             "Raster footprint cannot be computed for an asset with no bands."
         )
-    if nodata is not None and len(set(reader.nodatavals)) != 1:
+    if nodata is not None and not _all_equal(reader.nodatavals):
         raise ValueError(
             "When specifying a 'nodata' value, all raster bands must have "
             "the same 'nodata' value."
         )
+    if out is not None and (
+        out.shape != reader.shape or out.dtype != np.uint8 or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            "'out' must be a C-contiguous uint8 array with the same shape as "
+            "the raster."
+        )
 
-    if with_nodata:
-        mask = np.full(reader.shape[-2:], fill_value=255, dtype=np.uint8)
-    elif nodata is None or nodata == reader.nodata:
-        if not bands:
-            mask = reader.dataset_mask()
-        elif len(bands) == 1:
-            mask = reader.read_masks(bands)
-        else:
-            mask = reader.read_masks(bands)
-            mask = np.sum(mask, axis=0, dtype=np.uint8)
-            mask[mask > 0] = 255
+    if with_nodata or (
+        (nodata is None or nodata == reader.nodata) and _masks_all_valid(reader, bands)
+    ):
+        # every pixel is valid, so the footprint is the raster extent and
+        # there is no need to allocate and polygonize a mask
+        return _footprint_from_geometry(
+            _get_extent_geometry(
+                reader.shape[-2:], transform=reader.transform, convex_hull=convex_hull
+            ),
+            reader.crs,
+            destination_crs=destination_crs,
+            precision=precision,
+            densify_factor=densify_factor,
+            densify_distance=densify_distance,
+            simplify_tolerance=simplify_tolerance,
+        )
+
+    strips: Callable[..., Iterator[Tuple[int, npt.NDArray[np.uint8]]]]
+    if nodata is None or nodata == reader.nodata:
+        strips = partial(_band_mask_strips, reader, bands or [])
     else:
-        if not bands:
-            bands = reader.indexes
-        mask = create_mask(reader.read(bands), nodata=nodata)
+        strips = partial(_nodata_mask_strips, reader, bands or reader.indexes, nodata)
+
+    if convex_hull and downsample is None:
+        # the hull only depends on the extents of each row, so the whole mask
+        # does not need to be held in memory
+        geometry = _read_convex_hull(strips, reader.transform)
+        if geometry is None:
+            return None
+        return _footprint_from_geometry(
+            geometry,
+            reader.crs,
+            destination_crs=destination_crs,
+            precision=precision,
+            densify_factor=densify_factor,
+            densify_distance=densify_distance,
+            simplify_tolerance=simplify_tolerance,
+        )
 
     return footprint_from_mask(
-        mask,
+        _read_mask(strips, reader.shape, out),
         reader.transform,
         reader.crs,
         destination_crs=destination_crs,
@@ -331,4 +542,182 @@ def footprint_from_rasterio_reader(
         simplify_tolerance=simplify_tolerance,
         convex_hull=convex_hull,
         holes=holes,
+        downsample=downsample,
     )
+
+
+def _footprint_from_geometry(
+    geometry: Union[Polygon, MultiPolygon],
+    source_crs: CRS,
+    *,
+    destination_crs: CRS,
+    precision: int,
+    densify_factor: Optional[int],
+    densify_distance: Optional[float],
+    simplify_tolerance: Optional[float],
+) -> Dict[str, Any]:
+    """Densifies, reprojects, and simplifies a footprint geometry and returns
+    it as a GeoJSON dictionary."""
+    densified = densify_geometry(
+        geometry, factor=densify_factor, distance=densify_distance
+    )
+    reprojected = reproject_geometry(
+        densified, source_crs, destination_crs, precision=precision
+    )
+    simplified = simplify_geometry(reprojected, tolerance=simplify_tolerance)
+
+    return mapping(simplified)
+
+
+def _band_mask_strips(
+    reader: DatasetReader,
+    bands: List[int],
+    out: Optional[npt.NDArray[np.uint8]] = None,
+) -> Iterator[Tuple[int, npt.NDArray[np.uint8]]]:
+    """Reads the union of the masks of the given bands, or the dataset mask if
+    no bands are given, in block-aligned strips of rows.
+
+    Yields the offset of each strip's first row and the strip, which is a view
+    of ``out`` if given, or else a reused buffer. Only a single strip of one
+    band mask is held in memory besides the strips.
+    """
+    height, width = reader.shape
+    strip_height = _strip_height(reader)
+    strip_buffer = np.empty((strip_height, width), dtype=np.uint8)
+    buffer = np.empty((strip_height, width), dtype=np.uint8)
+    for row in range(0, height, strip_height):
+        window = Window(0, row, width, min(strip_height, height - row))
+        if out is None:
+            strip = strip_buffer[: window.height]
+        else:
+            strip = out[row : row + window.height]
+        if not bands:
+            strip[:] = reader.dataset_mask(window=window)
+            yield row, strip
+            continue
+        reader.read_masks(bands[0], window=window, out=strip)
+        for band in bands[1:]:
+            band_mask = reader.read_masks(
+                band, window=window, out=buffer[: window.height]
+            )
+            # read_masks returns 0/255 per band, so a bitwise OR across bands
+            # yields the 0/255 union mask
+            np.bitwise_or(strip, band_mask, out=strip)
+        yield row, strip
+
+
+def _nodata_mask_strips(
+    reader: DatasetReader,
+    bands: List[int],
+    nodata: Union[int, float],
+    out: Optional[npt.NDArray[np.uint8]] = None,
+) -> Iterator[Tuple[int, npt.NDArray[np.uint8]]]:
+    """Computes ``create_mask(reader.read(bands), nodata=nodata)`` in
+    block-aligned strips of rows, reading one band at a time into a reused
+    buffer so that only a single strip of one band of pixel data is held in
+    memory.
+
+    Yields strips as :func:`_band_mask_strips` does.
+    """
+    dtypes = dict(zip(reader.indexes, reader.dtypes))
+    if any(band not in dtypes for band in bands):
+        # lets rasterio raise its usual error for an invalid band
+        reader.read(bands, window=Window(0, 0, 1, 1))
+    # a band with no pixel that can equal nodata is valid everywhere, so there
+    # is no need to read any pixel data
+    all_valid = not all(_can_equal(np.dtype(dtypes[band]), nodata) for band in bands)
+
+    height, width = reader.shape
+    strip_height = _strip_height(reader)
+    strip_buffer = np.empty((strip_height, width), dtype=np.uint8)
+    scratch = np.empty((strip_height, width), dtype=bool)
+    buffers: Dict[str, npt.NDArray[Any]] = {}
+    for row in range(0, height, strip_height):
+        window = Window(0, row, width, min(strip_height, height - row))
+        if out is None:
+            strip = strip_buffer[: window.height]
+        else:
+            strip = out[row : row + window.height]
+        if all_valid:
+            strip.fill(255)
+            yield row, strip
+            continue
+        valid = strip.view(bool)
+        for index, band in enumerate(bands):
+            dtype = dtypes[band]
+            if dtype not in buffers:
+                buffers[dtype] = np.empty((strip_height, width), dtype=dtype)
+            band_data = reader.read(
+                band, window=window, out=buffers[dtype][: window.height]
+            )
+            if index == 0:
+                _set_valid(valid, band_data, nodata)
+            else:
+                _accumulate_valid(valid, band_data, nodata, scratch[: window.height])
+        yield row, _to_mask(valid)
+
+
+def _read_mask(
+    strips: Callable[..., Iterator[Tuple[int, npt.NDArray[np.uint8]]]],
+    shape: Tuple[int, int],
+    out: Optional[npt.NDArray[np.uint8]] = None,
+) -> npt.NDArray[np.uint8]:
+    """Reads all strips of a mask into ``out`` or a new array."""
+    mask = np.empty(shape, dtype=np.uint8) if out is None else out
+    for _ in strips(out=mask):
+        pass
+    return mask
+
+
+def _read_convex_hull(
+    strips: Callable[..., Iterator[Tuple[int, npt.NDArray[np.uint8]]]],
+    transform: Affine,
+) -> Optional[Polygon]:
+    """Computes the convex hull of the valid pixels of a mask one strip at a
+    time, keeping only the extents of each row rather than the whole mask.
+    The result is identical to
+    ``get_mask_geometry(mask, transform=transform, convex_hull=True)``."""
+    row_extents = []
+    top: Optional[npt.NDArray[np.bool_]] = None
+    bottom: Optional[npt.NDArray[np.bool_]] = None
+    for row, strip in strips():
+        valid = strip == 255
+        rows, first, end = _row_extents(valid)
+        if len(rows):
+            if top is None:
+                top = valid[rows[0]]
+            bottom = valid[rows[-1]]
+            row_extents.append((rows + row, first, end))
+    if top is None or bottom is None:
+        return None
+    rows, first, end = (np.concatenate(extents) for extents in zip(*row_extents))
+    return _convex_hull_of_rows(rows, first, end, top, bottom, transform=transform)
+
+
+def _strip_height(reader: DatasetReader) -> int:
+    """Returns the number of rows to read at a time: a whole number of blocks
+    spanning about ``_STRIP_PIXELS`` pixels."""
+    height, width = reader.shape
+    block_height = reader.block_shapes[0][0] if reader.block_shapes else 1
+    return int(
+        min(height, block_height * max(1, _STRIP_PIXELS // (block_height * width)))
+    )
+
+
+def _masks_all_valid(reader: DatasetReader, bands: Optional[List[int]]) -> bool:
+    """Checks whether GDAL reports that the masks of the given bands, or of all
+    bands for the dataset mask, have no invalid pixels; i.e., the bands have
+    no nodata value, internal mask, or alpha band."""
+    flags = dict(zip(reader.indexes, reader.mask_flag_enums))
+    return all(
+        flags.get(band) == [MaskFlags.all_valid] for band in bands or reader.indexes
+    )
+
+
+def _all_equal(nodatavals: Tuple[Optional[float], ...]) -> bool:
+    """Checks that all band nodata values are the same, stopping at the first
+    mismatch. NaN values are considered equal to each other."""
+    first = nodatavals[0]
+    if first is not None and np.isnan(first):
+        return all(value is not None and np.isnan(value) for value in nodatavals)
+    return all(value == first for value in nodatavals)
@@ -1,14 +1,27 @@
-from typing import Any, Optional, Union
+from itertools import chain
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import rasterio.features
 from affine import Affine
 from numpy import typing as npt
-from shapely import unary_union
-from shapely.geometry import shape
+from shapely import (
+    STRtree,
+    get_rings,
+    is_ccw,
+    linearrings,
+    multipoints,
+    polygons,
+    reverse,
+)
 from shapely.geometry.multipolygon import MultiPolygon
 from shapely.geometry.polygon import Polygon, orient
 
+# The number of pixels per tile when combining the validity of several bands,
+# sized so that a tile of booleans and its scratch tile fit in a typical L2
+# cache.
+_TILE_PIXELS = 2**18
+
 
 def create_mask(
     data_array: npt.NDArray[Any], *, nodata: Optional[Union[int, float]] = None
@@ -32,16 +45,22 @@ def create_mask(
         data_array = data_array[np.newaxis, :]
     array_shape = data_array.shape
     if nodata is not None:
-        mask: npt.NDArray[np.uint8] = np.full(array_shape, fill_value=0, dtype=np.uint8)
-        if np.isnan(nodata):
-            mask[~np.isnan(data_array)] = 1
+        if not len(data_array):
+            return np.zeros(array_shape[-2:], dtype=np.uint8)
+        if not _can_equal(data_array.dtype, nodata):
+            return np.full(array_shape[-2:], fill_value=255, dtype=np.uint8)
+        # the first band is compared straight into the result, so a 2D array
+        # takes a single pass and no scratch plane
+        valid = np.empty(array_shape[-2:], dtype=bool)
+        if len(data_array) == 1:
+            _set_valid(valid, np.ma.getdata(data_array[0]), nodata)
         else:
-            mask[data_array != nodata] = 1
-        mask = np.sum(mask, axis=0, dtype=np.uint8)
-        mask[mask > 0] = 255
-    else:
-        mask = np.full(array_shape[-2:], fill_value=255, dtype=np.uint8)
-    return mask
+            _combine_valid(valid, np.ma.getdata(data_array), nodata)
+        if np.ma.isMaskedArray(data_array) and not np.isnan(nodata):
+            # masked locations have always compared as not equal to nodata
+            np.logical_or(valid, np.ma.getmaskarray(data_array).any(axis=0), out=valid)
+        return _to_mask(valid)
+    return np.full(array_shape[-2:], fill_value=255, dtype=np.uint8)
 
 
 def get_mask_geometry(
@@ -50,6 +69,7 @@ def get_mask_geometry(
     transform: Affine = Affine(1, 0, 0, 0, 1, 0),
     convex_hull: bool = False,
     holes: bool = False,
+    downsample: Optional[int] = None,
 ) -> Optional[Union[Polygon, MultiPolygon]]:
     """Creates a polygon or multipolygon surrounding valid data pixels.
 
@@ -57,8 +77,9 @@ def get_mask_geometry(
     in the given ``mask``, where a valid data pixel has a value of 255.
 
     Args:
-        mask (numpy.NDArray[numpy.uint8]): A 2D NumPy array containing 0s and 255s
-            for nodata/data (invalid/valid) pixels.
+        mask (numpy.NDArray[numpy.uint8]): A 2D NumPy array, or a 3D array
+            with a single band, containing 0s and 255s for nodata/data
+            (invalid/valid) pixels.
         transform (Affine): An :class:`affine.Affine` object defining
             the affine transformation from pixel coordinates to a desired
             coordinate system. Defaults to an identity transform, which returns
@@ -67,39 +88,338 @@ def get_mask_geometry(
             polygons. Defaults to False.
         holes (bool): Whether to include holes in the created polygons. Has
             no effect if ``convex_hull`` is True. Defaults to False.
+        downsample (Optional[int]): The factor by which to reduce the mask
+            resolution before creating polygons. A reduced pixel is valid if
+            any of the pixels it covers is valid, so the polygons still cover
+            all valid data but may extend up to ``downsample - 1`` pixels
+            beyond it. Much faster for large masks. Has no effect if every
+            pixel is valid, in which case the mask extent is returned
+            exactly. Defaults to ``None``.
 
     Returns:
         Optional[Union[Polygon, MultiPolygon]: A polygon or multipolygon
         enclosing valid data pixels in the given ``mask``. The polygon vertex
         coordinates are transformed according to the given ``transform``.
     """
-    polygons = [
-        shape(polygon_dict)
-        for polygon_dict, region_value in rasterio.features.shapes(
-            mask, transform=transform
+    if mask.dtype == np.uint8 and mask.size and mask.min() == 255:
+        # every pixel is valid, so the only polygon is the raster extent;
+        # this is checked before downsampling, which could only enlarge it
+        return _get_extent_geometry(
+            mask.shape[-2:], transform=transform, convex_hull=convex_hull
+        )
+
+    if downsample is not None:
+        mask, transform = _downsample(mask, transform, downsample)
+
+    if convex_hull:
+        return _convex_hull_of_mask(mask, transform)
+
+    exteriors_only = not holes
+    # masking out the invalid pixels stops GDAL from tracing their regions,
+    # which are discarded anyway
+    polygon_rings = [
+        polygon_dict["coordinates"][:1]
+        if exteriors_only
+        else polygon_dict["coordinates"]
+        for polygon_dict, _ in rasterio.features.shapes(
+            mask, mask=mask == 255, transform=transform
         )
-        if region_value == 255
     ]
 
-    if not polygons:
+    if not polygon_rings:
         return None
 
-    if not holes and not convex_hull:
-        polygons = [Polygon(poly.exterior.coords) for poly in polygons]
-        unioned_polygons = unary_union(polygons)
-        if isinstance(unioned_polygons, Polygon):
-            polygons = [unioned_polygons]
-        else:
-            polygons = list(unioned_polygons.geoms)
+    polygon_list = list(_polygons_from_rings(polygon_rings))
+
+    if exteriors_only:
+        polygon_list = _remove_nested_polygons(polygon_list)
+
+    polygon_list = _orient_polygons(polygon_list)
+
+    if len(polygon_list) == 1:
+        return polygon_list[0]
+    return MultiPolygon(polygon_list)
+
+
+def _downsample(
+    mask: npt.NDArray[np.uint8], transform: Affine, factor: int
+) -> Tuple[npt.NDArray[np.uint8], Affine]:
+    """Reduces a mask by taking the maximum over each ``factor`` x ``factor``
+    block of pixels, and scales the transform to match."""
+    if factor < 1:
+        raise ValueError("'downsample' must be a positive integer.")
+    if factor == 1:
+        return mask, transform
+    height, width = mask.shape[-2:]
+    mask = mask.reshape(height, width)
+    rows = -(-height // factor)
+    cols = -(-width // factor)
+    if rows * factor != height or cols * factor != width:
+        padded = np.zeros((rows * factor, cols * factor), dtype=mask.dtype)
+        padded[:height, :width] = mask
+        mask = padded
+    reduced: npt.NDArray[np.uint8] = mask.reshape(rows, factor, cols, factor).max(
+        axis=(1, 3)
+    )
+    scaled = Affine(
+        transform.a * factor,
+        transform.b * factor,
+        transform.c,
+        transform.d * factor,
+        transform.e * factor,
+        transform.f,
+    )
+    return reduced, scaled
+
+
+def _polygons_from_rings(
+    polygon_rings: Sequence[Sequence[Sequence[Tuple[float, float]]]],
+) -> npt.NDArray[np.object_]:
+    """Builds polygons from GeoJSON-style lists of ring coordinates (shell
+    first) with two vectorized shapely calls rather than one ``shape`` call per
+    polygon."""
+    rings: List[Sequence[Tuple[float, float]]] = list(
+        chain.from_iterable(polygon_rings)
+    )
+    coordinates = np.array(list(chain.from_iterable(rings)), dtype=np.float64)
+    ring_indices = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+    polygon_indices = np.repeat(
+        np.arange(len(polygon_rings)), [len(rings) for rings in polygon_rings]
+    )
+    built: npt.NDArray[np.object_] = polygons(
+        linearrings(coordinates, indices=ring_indices), indices=polygon_indices
+    )
+    return built
+
+
+def _convex_hull_of_mask(
+    mask: npt.NDArray[Any], transform: Affine
+) -> Optional[Polygon]:
+    """Computes the convex hull of the valid pixels in a mask without
+    polygonizing it."""
+    valid = (mask == 255).reshape(mask.shape[-2:])
+    rows, first, end = _row_extents(valid)
+    if not len(rows):
+        return None
+    return _convex_hull_of_rows(
+        rows, first, end, valid[rows[0]], valid[rows[-1]], transform=transform
+    )
+
+
+def _row_extents(
+    valid: npt.NDArray[np.bool_],
+) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Returns the rows containing valid pixels, and the column of the first
+    valid pixel and the column past the last valid pixel in each of them."""
+    rows = np.flatnonzero(valid.any(axis=1))
+    first = valid[rows].argmax(axis=1)
+    end = valid.shape[1] - valid[rows, ::-1].argmax(axis=1)
+    return rows, first, end
+
+
+def _convex_hull_of_rows(
+    rows: npt.NDArray[np.intp],
+    first: npt.NDArray[np.intp],
+    end: npt.NDArray[np.intp],
+    top: npt.NDArray[np.bool_],
+    bottom: npt.NDArray[np.bool_],
+    *,
+    transform: Affine,
+) -> Polygon:
+    """Computes the convex hull of valid pixels from the extents of the rows
+    containing them (see :func:`_row_extents`) and the validity of the first
+    (``top``) and last (``bottom``) of those rows.
+
+    Only the vertices of the :func:`rasterio.features.shapes` polygons that
+    can lie on the hull are generated: the corners where the left and right
+    edges of the valid pixels turn, and the ends of the runs of valid pixels
+    along the top and bottom edges. Coordinates are computed as GDAL computes
+    the polygon vertices, so the result is identical to the hull of the
+    polygons, including for rotated or sheared transforms.
+    """
+    adjacent = rows[1:] == rows[:-1] + 1
+    left_cols, left_rows = _edge_corners(rows, first, adjacent)
+    right_cols, right_rows = _edge_corners(rows, end, adjacent)
+    top_cols = _run_ends(top)
+    bottom_cols = _run_ends(bottom)
+    cols = np.concatenate([left_cols, right_cols, top_cols, bottom_cols])
+    rows = np.concatenate(
+        [
+            left_rows,
+            right_rows,
+            np.full(len(top_cols), rows[0]),
+            np.full(len(bottom_cols), rows[-1] + 1),
+        ]
+    )
+    x = transform.c + transform.a * cols + transform.b * rows
+    y = transform.f + transform.d * cols + transform.e * rows
+    return orient(multipoints(np.column_stack([x, y])).convex_hull)
+
+
+def _edge_corners(
+    rows: npt.NDArray[np.intp],
+    cols: npt.NDArray[np.intp],
+    adjacent: npt.NDArray[np.bool_],
+) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Returns the top and bottom corners of an edge pixel in each row, except
+    corners where the edge continues straight into the adjacent row."""
+    straight = adjacent & (cols[1:] == cols[:-1])
+    top = np.ones(len(rows), dtype=bool)
+    top[1:] = ~straight
+    bottom = np.ones(len(rows), dtype=bool)
+    bottom[:-1] = ~straight
+    return (
+        np.concatenate([cols[top], cols[bottom]]),
+        np.concatenate([rows[top], rows[bottom] + 1]),
+    )
 
-    polygons = [orient(poly) for poly in polygons]
 
-    if len(polygons) == 1:
-        geometry = polygons[0]
+def _run_ends(row: npt.NDArray[np.bool_]) -> npt.NDArray[np.intp]:
+    """Returns the column offsets at which runs of valid pixels start and end."""
+    return np.flatnonzero(np.diff(row, prepend=False, append=False))
+
+
+def _remove_nested_polygons(polygon_list: List[Polygon]) -> List[Polygon]:
+    """Drops polygons that lie within another polygon.
+
+    Once holes are filled, each region of valid pixels inside a hole is
+    covered by the polygon around it. The polygons produced by
+    :func:`rasterio.features.shapes` are otherwise disjoint, apart from
+    touching at corners, so removing the covered polygons yields the same
+    geometry as a union without the cost of an overlay.
+    """
+    if len(polygon_list) == 1:
+        return polygon_list
+    inner, outer = STRtree(polygon_list).query(polygon_list, predicate="within")
+    nested = np.unique(inner[inner != outer])
+    if not len(nested):
+        return polygon_list
+    keep = np.ones(len(polygon_list), dtype=bool)
+    keep[nested] = False
+    return [polygon for polygon, kept in zip(polygon_list, keep) if kept]
+
+
+def _orient_polygons(polygon_list: List[Polygon]) -> List[Polygon]:
+    """Equivalent to ``[orient(polygon) for polygon in polygon_list]``, but
+    checks the winding of all rings in one vectorized call and only rebuilds
+    the polygons if a ring needs to be reversed."""
+    rings, polygon_indices = get_rings(polygon_list, return_index=True)
+    exteriors = np.ones(len(rings), dtype=bool)
+    exteriors[1:] = polygon_indices[1:] != polygon_indices[:-1]
+    # exteriors must be counter-clockwise and interiors clockwise
+    misoriented = is_ccw(rings) != exteriors
+    if not misoriented.any():
+        return polygon_list
+    rings[misoriented] = reverse(rings[misoriented])
+    return list(polygons(rings, indices=polygon_indices))
+
+
+def _can_equal(dtype: np.dtype, nodata: Union[int, float]) -> bool:
+    """Checks whether any value of an integer or boolean ``dtype`` can equal
+    ``nodata``; e.g., no uint8 value can equal -9999 or 0.5."""
+    if dtype.kind not in "biu":
+        return True
+    if not np.isfinite(nodata) or not float(nodata).is_integer():
+        return False
+    if dtype.kind == "b":
+        return nodata in (0, 1)
+    info = np.iinfo(dtype)
+    return bool(info.min <= nodata <= info.max)
+
+
+def _set_valid(
+    valid: npt.NDArray[np.bool_],
+    band_data: npt.NDArray[Any],
+    nodata: Union[int, float],
+) -> None:
+    """Writes the locations in a single band of data that do not match
+    ``nodata`` into ``valid``."""
+    if np.isnan(nodata):
+        np.isnan(band_data, out=valid)
+        np.logical_not(valid, out=valid)
     else:
-        geometry = MultiPolygon(polygons)
+        np.not_equal(band_data, nodata, out=valid)
 
-    if convex_hull:
-        geometry = orient(geometry.convex_hull)
 
-    return geometry
+def _accumulate_valid(
+    valid: npt.NDArray[np.bool_],
+    band_data: npt.NDArray[Any],
+    nodata: Union[int, float],
+    scratch: npt.NDArray[np.bool_],
+) -> None:
+    """ORs the locations in a single band of data that do not match ``nodata``
+    into ``valid`` in place, using ``scratch`` for the comparison."""
+    if nodata == 0 and band_data.dtype.kind in "biu":
+        # integer values are valid exactly when they are truthy, so the
+        # comparison can be fused into the OR
+        np.logical_or(valid, band_data, out=valid)
+        return
+    _set_valid(scratch, band_data, nodata)
+    np.logical_or(valid, scratch, out=valid)
+
+
+def _combine_valid(
+    valid: npt.NDArray[np.bool_],
+    data_array: npt.NDArray[Any],
+    nodata: Union[int, float],
+) -> None:
+    """Writes the locations where any band of a 3D array does not match
+    ``nodata`` into ``valid``.
+
+    The bands are combined in tiles of rows small enough for the tile of
+    ``valid`` and the scratch plane to stay in cache across bands, rather than
+    streaming both through memory once per band.
+    """
+    height, width = valid.shape
+    tile_height = max(1, _TILE_PIXELS // max(width, 1))
+    scratch = np.empty((tile_height, width), dtype=bool)
+    for row in range(0, height, tile_height):
+        rows = slice(row, row + tile_height)
+        valid_tile = valid[rows]
+        _set_valid(valid_tile, data_array[0, rows], nodata)
+        for band_data in data_array[1:]:
+            _accumulate_valid(
+                valid_tile, band_data[rows], nodata, scratch[: len(valid_tile)]
+            )
+
+
+def _to_mask(valid: npt.NDArray[np.bool_]) -> npt.NDArray[np.uint8]:
+    """Converts a boolean array to a 0/255 mask in place."""
+    mask: npt.NDArray[np.uint8] = valid.view(np.uint8)
+    mask *= 255
+    return mask
+
+
+def _get_extent_geometry(
+    shape: Tuple[int, int],
+    *,
+    transform: Affine = Affine(1, 0, 0, 0, 1, 0),
+    convex_hull: bool = False,
+) -> Polygon:
+    """Creates the polygon that :func:`get_mask_geometry` would return for a
+    mask of the given ``shape`` in which every pixel is valid, without
+    allocating or polygonizing the mask.
+
+    The corners are visited in the same order as GDAL's polygonizer and are
+    transformed with the same arithmetic, so the result is identical.
+    """
+    height, width = shape
+    a, b, c, d, e, f = (
+        transform.a,
+        transform.b,
+        transform.c,
+        transform.d,
+        transform.e,
+        transform.f,
+    )
+    polygon = orient(
+        Polygon(
+            [
+                (c + a * col + b * row, f + d * col + e * row)
+                for col, row in ((0, 0), (0, height), (width, height), (width, 0))
+            ]
+        )
+    )
+    if convex_hull:
+        polygon = orient(polygon.convex_hull)
+    return polygon
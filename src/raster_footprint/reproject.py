@@ -1,12 +1,21 @@
-from typing import Optional
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
+from numpy import typing as npt
 from rasterio.crs import CRS
 from rasterio.warp import transform_geom
+from shapely import get_coordinates, get_rings, linearrings, polygons, transform
 from shapely.constructive import remove_repeated_points
 from shapely.geometry import shape
+from shapely.geometry.multipolygon import MultiPolygon
+from shapely.geometry.polygon import Polygon
 
 from .constants import DEFAULT_PRECISION, T
 
+# 10**22 is the largest power of ten that is exactly representable as a float.
+_MAX_EXACT_POWER_OF_TEN = 22
+
 
 def reproject_geometry(
     geometry: T,
@@ -18,7 +27,9 @@ def reproject_geometry(
     """Reprojects a polygon or multipolygon from a source CRS to a destination CRS.
 
     Reprojected polygon vertex coordinates are rounded to ``precision``.
-    Duplicate points caused by rounding are removed.
+    Duplicate points caused by rounding are removed. If the source and
+    destination CRS are the same, the coordinates are only rounded.
+    Coordinates are not rounded if ``precision`` is ``None`` or negative.
 
     Args:
         geometry (T): The polygon or multipolygon to reproject.
@@ -32,8 +43,72 @@ def reproject_geometry(
     Returns:
         T: The reprojected polygon or multipolygon.
     """
-    return remove_repeated_points(
-        shape(
-            transform_geom(source_crs, destination_crs, geometry, precision=precision)
+    # Parse each CRS once; transform_geom would otherwise parse EPSG codes and
+    # strings again after the comparison.
+    source_crs = CRS.from_user_input(source_crs)
+    destination_crs = CRS.from_user_input(destination_crs)
+    if source_crs != destination_crs:
+        geometry = _from_geojson(
+            transform_geom(source_crs, destination_crs, _to_geojson(geometry))
+        )
+    if precision is not None and precision >= 0:
+        geometry = transform(geometry, partial(_round, precision=precision))
+    return remove_repeated_points(geometry)
+
+
+def _to_geojson(geometry: T) -> Dict[str, Any]:
+    """Builds the GeoJSON-like dictionary of a polygon or multipolygon from
+    whole-ring coordinate arrays, which is much faster than
+    ``__geo_interface__`` for rings with many vertices."""
+    if isinstance(geometry, Polygon):
+        return {"type": "Polygon", "coordinates": _ring_coordinates(geometry)}
+    return {
+        "type": "MultiPolygon",
+        "coordinates": [_ring_coordinates(polygon) for polygon in geometry.geoms],
+    }
+
+
+def _from_geojson(geojson: Dict[str, Any]) -> Any:
+    """Builds a polygon or multipolygon from a GeoJSON-like dictionary. Other
+    geometry types are left to :func:`shapely.geometry.shape`."""
+    if geojson["type"] == "Polygon":
+        return _polygon(geojson["coordinates"])
+    if geojson["type"] == "MultiPolygon":
+        return MultiPolygon([_polygon(rings) for rings in geojson["coordinates"]])
+    return shape(geojson)
+
+
+def _ring_coordinates(polygon: Polygon) -> List[List[List[float]]]:
+    return [get_coordinates(ring).tolist() for ring in get_rings(polygon)]
+
+
+def _polygon(rings: Sequence[Sequence[Sequence[float]]]) -> Polygon:
+    shell, *holes = [linearrings(ring) for ring in rings]
+    return polygons(shell, holes=holes or None)
+
+
+def _round(
+    coordinates: npt.NDArray[np.float64], *, precision: int
+) -> npt.NDArray[np.float64]:
+    """Rounds coordinates to the same values as Python's correctly rounded
+    ``round``, as ``transform_geom`` does with its ``precision`` argument.
+
+    Scaling, rounding to an integer, and scaling back gives the correctly
+    rounded result unless the scaled value lies within its own rounding error
+    of a tie, which ``np.round`` does not account for. Only those coordinates
+    are rounded with ``round``.
+    """
+    if precision > _MAX_EXACT_POWER_OF_TEN:
+        return np.vectorize(partial(round, ndigits=precision), otypes=[float])(
+            coordinates
+        )
+    scale = 10.0**precision
+    with np.errstate(over="ignore", invalid="ignore"):
+        scaled = coordinates * scale
+        rounded = np.rint(scaled)
+        rounded /= scale
+        inexact = ~(np.abs(scaled) < 2**52) | (
+            np.abs(scaled - np.floor(scaled) - 0.5) <= np.abs(scaled) * 2**-52
         )
-    )
+    rounded[inexact] = [round(x, precision) for x in coordinates[inexact].tolist()]
+    return rounded
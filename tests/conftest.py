@@ -1,13 +1,31 @@
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Union
 
+import numpy as np
+from shapely import get_parts, get_rings, is_ccw
 from shapely.geometry import MultiPolygon, Polygon, shape
 
 TEST_DATA_DIRECTORY = Path(__file__).parent / "data"
 
 
 def read_geojson(name: str) -> Dict[str, Any]:
+    """Reads a GeoJSON test fixture. Fixtures are parsed once; each call
+    returns a copy, so a test that modifies it cannot affect other tests."""
+    return copy.deepcopy(_load_geojson(name))
+
+
+@lru_cache(maxsize=None)
+def read_geometry(name: str) -> Union[Polygon, MultiPolygon]:
+    """Reads a GeoJSON test fixture as a shared, immutable shapely geometry."""
+    geometry: Union[Polygon, MultiPolygon] = shape(_load_geojson(name))
+    return geometry
+
+
+@lru_cache(maxsize=None)
+def _load_geojson(name: str) -> Dict[str, Any]:
     path = (TEST_DATA_DIRECTORY / "geojson" / name).with_suffix(".json")
     with open(path) as f:
         data: Dict[str, Any] = json.load(f)
@@ -18,14 +36,11 @@ def check_winding(geometry: Union[Polygon, MultiPolygon, Dict[str, Any]]) -> Non
     if isinstance(geometry, dict):
         geometry = shape(geometry)
 
-    if isinstance(geometry, Polygon):
-        assert geometry.exterior.is_ccw
-        for interior in geometry.interiors:
-            assert not interior.is_ccw
-    elif isinstance(geometry, MultiPolygon):
-        for polygon in geometry.geoms:
-            assert polygon.exterior.is_ccw
-            for interior in polygon.interiors:
-                assert not interior.is_ccw
-    else:
+    if not isinstance(geometry, (Polygon, MultiPolygon)):
         raise TypeError("'geometry' must be a Polygon, MultiPolygon, or GeoJSON dict")
+
+    # exteriors must be counter-clockwise and interiors clockwise
+    rings, polygon_indices = get_rings(get_parts(geometry), return_index=True)
+    exteriors = np.ones(len(rings), dtype=bool)
+    exteriors[1:] = polygon_indices[1:] != polygon_indices[:-1]
+    assert np.array_equal(is_ccw(rings), exteriors)
@@ -1,14 +1,25 @@
 import json
 import os
 import subprocess
+import sys
 from tempfile import TemporaryDirectory
+from typing import List
 
+import pytest
+from raster_footprint._cli import cli
 from shapely.geometry import shape
 
-from tests.conftest import TEST_DATA_DIRECTORY, check_winding, read_geojson
+from tests.conftest import TEST_DATA_DIRECTORY, check_winding, read_geometry
 
 
-def test_cli_create() -> None:
+def run_cli(monkeypatch: pytest.MonkeyPatch, args: List[str]) -> None:
+    """Runs the command line interface in this process, rather than paying for
+    interpreter startup and imports in a subprocess for every invocation."""
+    monkeypatch.setattr(sys, "argv", ["raster-footprint", *args])
+    cli()
+
+
+def test_cli_create(monkeypatch: pytest.MonkeyPatch) -> None:
     infile = os.path.join(
         TEST_DATA_DIRECTORY,
         "geotiff",
@@ -19,9 +30,9 @@ def test_cli_create() -> None:
 
     with TemporaryDirectory() as tmp_dir:
         outfile = os.path.join(tmp_dir, "from_href.json")
-        subprocess.run(
+        run_cli(
+            monkeypatch,
             [
-                "raster-footprint",
                 "create",
                 infile,
                 "--outfile",
@@ -32,20 +43,19 @@ def test_cli_create() -> None:
                 str(simplify_tolerance),
                 "--holes",
             ],
-            check=True,
         )
 
         with open(outfile) as f:
             from_href = shape(json.load(f))
-        expected = shape(
-            read_geojson("modis-densify_distance-100000-simplify_tolerance-0.01.json")
+        expected = read_geometry(
+            "modis-densify_distance-100000-simplify_tolerance-0.01.json"
         )
 
         check_winding(from_href)
         assert from_href.normalize() == expected.normalize()
 
 
-def test_cli_densify() -> None:
+def test_cli_densify(monkeypatch: pytest.MonkeyPatch) -> None:
     infile = os.path.join(
         TEST_DATA_DIRECTORY,
         "geojson",
@@ -56,9 +66,9 @@ def test_cli_densify() -> None:
 
     with TemporaryDirectory() as tmp_dir:
         outfile_factor = os.path.join(tmp_dir, "densified_by_factor.json")
-        subprocess.run(
+        run_cli(
+            monkeypatch,
             [
-                "raster-footprint",
                 "densify",
                 infile,
                 "--outfile",
@@ -66,7 +76,6 @@ def test_cli_densify() -> None:
                 "--factor",
                 str(factor),
             ],
-            check=True,
         )
         with open(outfile_factor) as f:
             densified_by_factor = shape(json.load(f))
@@ -75,9 +84,9 @@ def test_cli_densify() -> None:
         assert len(densified_by_factor.exterior.coords) == 25
 
         outfile_distance = os.path.join(tmp_dir, "densified_by_distance.json")
-        subprocess.run(
+        run_cli(
+            monkeypatch,
             [
-                "raster-footprint",
                 "densify",
                 infile,
                 "--outfile",
@@ -85,7 +94,6 @@ def test_cli_densify() -> None:
                 "--distance",
                 str(distance),
             ],
-            check=True,
         )
         with open(outfile_distance) as f:
             densified_by_distance = shape(json.load(f))
@@ -94,7 +102,7 @@ def test_cli_densify() -> None:
         assert len(densified_by_distance.exterior.coords) == 29
 
 
-def test_cli_reproject() -> None:
+def test_cli_reproject(monkeypatch: pytest.MonkeyPatch) -> None:
     infile = os.path.join(
         TEST_DATA_DIRECTORY,
         "geojson",
@@ -106,9 +114,9 @@ def test_cli_reproject() -> None:
 
     with TemporaryDirectory() as tmp_dir:
         outfile = os.path.join(tmp_dir, "reprojected.json")
-        subprocess.run(
+        run_cli(
+            monkeypatch,
             [
-                "raster-footprint",
                 "reproject",
                 infile,
                 str(source_epsg),
@@ -118,18 +126,17 @@ def test_cli_reproject() -> None:
                 "--precision",
                 str(precision),
             ],
-            check=True,
         )
 
         with open(outfile) as f:
             reprojected = shape(json.load(f))
-        expected = shape(read_geojson("two-concave-shells-each-with-two-holes.json"))
+        expected = read_geometry("two-concave-shells-each-with-two-holes.json")
 
         check_winding(reprojected)
         assert reprojected.normalize() == expected.normalize()
 
 
-def test_cli_simplify() -> None:
+def test_cli_simplify(monkeypatch: pytest.MonkeyPatch) -> None:
     infile = os.path.join(
         TEST_DATA_DIRECTORY,
         "geojson",
@@ -139,9 +146,9 @@ def test_cli_simplify() -> None:
 
     with TemporaryDirectory() as tmp_dir:
         outfile = os.path.join(tmp_dir, "simplified.json")
-        subprocess.run(
+        run_cli(
+            monkeypatch,
             [
-                "raster-footprint",
                 "simplify",
                 infile,
                 "--outfile",
@@ -149,12 +156,36 @@ def test_cli_simplify() -> None:
                 "--tolerance",
                 str(tolerance),
             ],
-            check=True,
         )
 
         with open(outfile) as f:
             simplified = shape(json.load(f))
-        expected = shape(read_geojson("convex-hull-of-concave-shell.json"))
+        expected = read_geometry("convex-hull-of-concave-shell.json")
 
         check_winding(simplified)
         assert simplified.normalize() == expected.normalize()
+
+
+def test_cli_import_does_not_load_rasterio() -> None:
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import raster_footprint._cli; "
+            "assert 'rasterio' not in sys.modules",
+        ],
+        check=True,
+    )
+
+
+def test_import_submodule_attribute() -> None:
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import raster_footprint; "
+            "assert raster_footprint.footprint.footprint_from_href; "
+            "assert raster_footprint.mask.create_mask",
+        ],
+        check=True,
+    )
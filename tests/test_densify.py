@@ -1,8 +1,8 @@
 import pytest
 from raster_footprint import densify_by_distance, densify_by_factor, densify_geometry
-from shapely.geometry import Point, shape
+from shapely.geometry import Point
 
-from .conftest import check_winding, read_geojson
+from .conftest import check_winding, read_geometry
 
 SQUARE = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0), (0.0, 0.0)]
 
@@ -21,8 +21,17 @@ def test_densify_by_factor() -> None:
     assert len(densified_coords) == 9
 
 
+def test_densify_without_new_points() -> None:
+    assert densify_by_factor(SQUARE, 1) == SQUARE
+    assert densify_by_distance(SQUARE, 20) == SQUARE
+
+    polygon = read_geometry("concave-shell-with-two-holes.json")
+    assert densify_geometry(polygon, factor=1) is polygon
+    assert densify_geometry(polygon, distance=1000) is polygon
+
+
 def test_densify_polygon() -> None:
-    polygon = shape(read_geojson("concave-shell.json"))
+    polygon = read_geometry("concave-shell.json")
     assert len(polygon.exterior.coords) == 13
 
     densified_by_factor = densify_geometry(polygon, factor=2)
@@ -35,7 +44,7 @@ def test_densify_polygon() -> None:
 
 
 def test_densify_polygon_with_holes() -> None:
-    polygon = shape(read_geojson("concave-shell-with-two-holes.json"))
+    polygon = read_geometry("concave-shell-with-two-holes.json")
     assert len(polygon.exterior.coords) == 13
     assert len(polygon.interiors) == 2
     for interior in polygon.interiors:
@@ -57,7 +66,7 @@ def test_densify_polygon_with_holes() -> None:
 
 
 def test_densify_multi_polygon_with_holes() -> None:
-    multi_polygon = shape(read_geojson("two-concave-shells-each-with-two-holes.json"))
+    multi_polygon = read_geometry("two-concave-shells-each-with-two-holes.json")
     for polygon in multi_polygon.geoms:
         assert len(polygon.exterior.coords) == 13
         assert len(polygon.interiors) == 2
@@ -93,8 +102,8 @@ def test_densify_precision() -> None:
                         assert len(str(value).split(".")[1]) <= precision
 
     precision = 6
-    multipolygon = shape(
-        read_geojson("two-concave-shells-each-with-two-holes-wkt-sinusoidal")
+    multipolygon = read_geometry(
+        "two-concave-shells-each-with-two-holes-wkt-sinusoidal"
     )
 
     densified_by_factor = densify_geometry(multipolygon, factor=2, precision=precision)
@@ -110,9 +119,7 @@ def test_double_option_fails() -> None:
     with pytest.raises(
         ValueError, match="Only one of 'factor' or 'distance' can be specified."
     ):
-        densify_geometry(
-            shape(read_geojson("concave-shell.json")), factor=2, distance=1
-        )
+        densify_geometry(read_geometry("concave-shell.json"), factor=2, distance=1)
 
 
 def test_not_polygon_or_multi_polygon_fails() -> None:
@@ -7,18 +7,25 @@ internally by those functions.
 
 import shutil
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 import pytest
 import rasterio
 from numpy import typing as npt
-from raster_footprint.footprint import footprint_from_data, footprint_from_href
+from raster_footprint import footprint as footprint_module
+from raster_footprint.footprint import (
+    footprint_from_data,
+    footprint_from_href,
+    footprint_from_mask,
+    footprint_from_rasterio_reader,
+    footprints_from_hrefs,
+)
 from rasterio import Affine
 from rasterio.crs import CRS
 from shapely.geometry import shape
 
-from .conftest import TEST_DATA_DIRECTORY, check_winding, read_geojson
+from .conftest import TEST_DATA_DIRECTORY, check_winding, read_geometry
 
 HrefDataCrsTransform = Tuple[str, npt.NDArray[np.uint8], CRS, Affine]
 
@@ -56,103 +63,103 @@ def test_no_footprint() -> None:
 
 def test_modis(modis_href_data_crs_transform: HrefDataCrsTransform) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson("modis.json")
+    expected = read_geometry("modis.json")
 
     href_footprint = footprint_from_href(href, holes=True)
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(
         data_array, transform, crs, nodata=32767, holes=True
     )
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_modis_with_nodata(modis_href_data_crs_transform: HrefDataCrsTransform) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson("modis-with_nodata.json")
+    expected = read_geometry("modis-with_nodata.json")
 
     href_footprint = footprint_from_href(href, with_nodata=True)
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(data_array, transform, crs)
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_modis_precision(modis_href_data_crs_transform: HrefDataCrsTransform) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson("modis-precision-1.json")
+    expected = read_geometry("modis-precision-1.json")
 
     href_footprint = footprint_from_href(href, precision=1, holes=True)
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(
         data_array, transform, crs, nodata=32767, precision=1, holes=True
     )
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_modis_densify_factor(
     modis_href_data_crs_transform: HrefDataCrsTransform,
 ) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson("modis-densify_factor-2.json")
+    expected = read_geometry("modis-densify_factor-2.json")
 
     href_footprint = footprint_from_href(href, densify_factor=2, holes=True)
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(
         data_array, transform, crs, nodata=32767, densify_factor=2, holes=True
     )
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_modis_densify_distance(
     modis_href_data_crs_transform: HrefDataCrsTransform,
 ) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson("modis-densify_distance-100000.json")
+    expected = read_geometry("modis-densify_distance-100000.json")
 
     href_footprint = footprint_from_href(href, densify_distance=100000, holes=True)
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(
         data_array, transform, crs, nodata=32767, densify_distance=100000, holes=True
     )
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_modis_simplify_tolerance(
     modis_href_data_crs_transform: HrefDataCrsTransform,
 ) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson("modis-simplify_tolerance-0.05.json")
+    expected = read_geometry("modis-simplify_tolerance-0.05.json")
 
     href_footprint = footprint_from_href(href, simplify_tolerance=0.05, holes=True)
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(
         data_array, transform, crs, nodata=32767, simplify_tolerance=0.05, holes=True
     )
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_modis_densify_distance_and_simplify_tolerance(
     modis_href_data_crs_transform: HrefDataCrsTransform,
 ) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson(
+    expected = read_geometry(
         "modis-densify_distance-100000-simplify_tolerance-0.01.json"
     )
 
@@ -160,7 +167,7 @@ def test_modis_densify_distance_and_simplify_tolerance(
         href, densify_distance=100000, simplify_tolerance=0.01, holes=True
     )
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(
         data_array,
@@ -172,49 +179,66 @@ def test_modis_densify_distance_and_simplify_tolerance(
         holes=True,
     )
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_modis_convex_hull(modis_href_data_crs_transform: HrefDataCrsTransform) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson("modis-convex_hull.json")
+    expected = read_geometry("modis-convex_hull.json")
 
     href_footprint = footprint_from_href(href, convex_hull=True)
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(
         data_array, transform, crs, nodata=32767, convex_hull=True
     )
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_modis_no_holes(modis_href_data_crs_transform: HrefDataCrsTransform) -> None:
     href, data_array, crs, transform = modis_href_data_crs_transform
-    expected = read_geojson("modis-no_holes.json")
+    expected = read_geometry("modis-no_holes.json")
 
     href_footprint = footprint_from_href(href)
     check_winding(href_footprint)
-    assert shape(href_footprint).normalize() == shape(expected).normalize()
+    assert shape(href_footprint).normalize() == expected.normalize()
 
     data_footprint = footprint_from_data(data_array, transform, crs, nodata=32767)
     check_winding(data_footprint)
-    assert shape(data_footprint).normalize() == shape(expected).normalize()
+    assert shape(data_footprint).normalize() == expected.normalize()
+
+
+def test_modis_no_holes_simplify_tolerance(
+    modis_href_data_crs_transform: HrefDataCrsTransform,
+) -> None:
+    href, data_array, crs, transform = modis_href_data_crs_transform
+    expected = read_geometry("modis-no_holes-simplify_tolerance-0.05.json")
+
+    href_footprint = footprint_from_href(href, simplify_tolerance=0.05)
+    check_winding(href_footprint)
+    assert shape(href_footprint).normalize() == expected.normalize()
+
+    data_footprint = footprint_from_data(
+        data_array, transform, crs, nodata=32767, simplify_tolerance=0.05
+    )
+    check_winding(data_footprint)
+    assert shape(data_footprint).normalize() == expected.normalize()
 
 
 def test_multiband_all_bands() -> None:
     footprint = footprint_from_href(ASTER_HREF, simplify_tolerance=0.005)
     check_winding(footprint)
-    expected = read_geojson("aster-all-bands.json")
-    assert shape(footprint).normalize() == shape(expected).normalize()
+    expected = read_geometry("aster-all-bands.json")
+    assert shape(footprint).normalize() == expected.normalize()
 
 
 def test_multiband_single_band() -> None:
     footprint = footprint_from_href(ASTER_HREF, bands=[2], simplify_tolerance=0.005)
     check_winding(footprint)
-    expected = read_geojson("aster-band-2.json")
-    assert shape(footprint).normalize() == shape(expected).normalize()
+    expected = read_geometry("aster-band-2.json")
+    assert shape(footprint).normalize() == expected.normalize()
 
 
 def test_multiband_some_bands() -> None:
@@ -222,8 +246,56 @@ def test_multiband_some_bands() -> None:
         ASTER_HREF, bands=[1, 4, 5, 6], simplify_tolerance=0.005
     )
     check_winding(footprint)
-    expected = read_geojson("aster-bands-1-4-5-6.json")
-    assert shape(footprint).normalize() == shape(expected).normalize()
+    expected = read_geometry("aster-bands-1-4-5-6.json")
+    assert shape(footprint).normalize() == expected.normalize()
+
+
+def test_multiband_reused_buffer() -> None:
+    expected = read_geometry("aster-bands-1-4-5-6.json")
+    with rasterio.open(ASTER_HREF) as reader:
+        out = np.empty(reader.shape, dtype=np.uint8)
+        for _ in range(2):
+            footprint = footprint_from_rasterio_reader(
+                reader, bands=[1, 4, 5, 6], simplify_tolerance=0.005, out=out
+            )
+            check_winding(footprint)
+            assert shape(footprint).normalize() == expected.normalize()
+
+
+def test_invalid_buffer() -> None:
+    with rasterio.open(ASTER_HREF) as reader:
+        height, width = reader.shape
+        for out in [
+            np.empty((height + 20, width), dtype=np.uint8),
+            np.empty(reader.shape, dtype=np.uint16),
+            np.empty((width, height), dtype=np.uint8).T,
+        ]:
+            with pytest.raises(ValueError):
+                footprint_from_rasterio_reader(reader, out=out)
+
+
+def test_footprints_from_hrefs(
+    modis_href_data_crs_transform: HrefDataCrsTransform,
+) -> None:
+    modis_href = modis_href_data_crs_transform[0]
+    hrefs = [ASTER_HREF, modis_href, ASTER_HREF]
+    footprints = footprints_from_hrefs(hrefs, max_workers=2, precision=4)
+    assert footprints == [footprint_from_href(href, precision=4) for href in hrefs]
+    threaded = footprints_from_hrefs(
+        hrefs, max_workers=2, precision=4, use_threads=True
+    )
+    assert threaded == footprints
+
+
+def test_multiband_downsample() -> None:
+    with rasterio.open(ASTER_HREF) as reader:
+        crs = reader.crs
+    footprint = footprint_from_href(ASTER_HREF, destination_crs=crs, bands=[1, 4])
+    downsampled = footprint_from_href(
+        ASTER_HREF, destination_crs=crs, bands=[1, 4], downsample=4
+    )
+    check_winding(downsampled)
+    assert shape(downsampled).covers(shape(footprint))
 
 
 def test_nonmatching_nodata_all_bands(tmp_path: Path) -> None:
@@ -234,8 +306,30 @@ def test_nonmatching_nodata_all_bands(tmp_path: Path) -> None:
 
     footprint = footprint_from_href(tmp_href, nodata=0, simplify_tolerance=0.005)
     check_winding(footprint)
-    expected = read_geojson("aster-all-bands.json")
-    assert shape(footprint).normalize() == shape(expected).normalize()
+    expected = read_geometry("aster-all-bands.json")
+    assert shape(footprint).normalize() == expected.normalize()
+
+
+def test_nan_nodata_all_bands() -> None:
+    data = np.ones((2, 4, 4), dtype=np.float32)
+    data[:, 0, 0] = np.nan
+    profile = {
+        "driver": "GTiff",
+        "width": 4,
+        "height": 4,
+        "count": 2,
+        "dtype": "float32",
+        "nodata": np.nan,
+        "crs": "EPSG:4326",
+        "transform": Affine(1, 0, 10, 0, -1, 10),
+    }
+    with rasterio.MemoryFile() as memfile:
+        with memfile.open(**profile) as dataset:
+            dataset.write(data)
+        with memfile.open() as reader:
+            footprint = footprint_from_rasterio_reader(reader, nodata=np.nan)
+    assert footprint is not None
+    assert shape(footprint).area == 15
 
 
 def test_nonmatching_nodata_some_bands(tmp_path: Path) -> None:
@@ -248,5 +342,39 @@ def test_nonmatching_nodata_some_bands(tmp_path: Path) -> None:
         tmp_href, nodata=0, bands=[1, 4, 5, 6], simplify_tolerance=0.005
     )
     check_winding(footprint)
-    expected = read_geojson("aster-bands-1-4-5-6.json")
-    assert shape(footprint).normalize() == shape(expected).normalize()
+    expected = read_geometry("aster-bands-1-4-5-6.json")
+    assert shape(footprint).normalize() == expected.normalize()
+
+
+@pytest.mark.parametrize("nodata", [None, 0])
+def test_mask_read_in_strips(
+    monkeypatch: pytest.MonkeyPatch, nodata: Optional[int]
+) -> None:
+    expected = footprint_from_href(ASTER_HREF, nodata=nodata, bands=[1, 2, 3])
+    monkeypatch.setattr(footprint_module, "_STRIP_PIXELS", 1)
+    footprint = footprint_from_href(ASTER_HREF, nodata=nodata, bands=[1, 2, 3])
+    assert footprint == expected
+
+
+def test_no_nodata_is_extent(tmp_path: Path) -> None:
+    tmp_href = str(tmp_path / "test.tif")
+    shutil.copy(ASTER_HREF, tmp_href)
+    with rasterio.open(tmp_href, "r+") as src:
+        src.nodata = None
+
+    expected = footprint_from_href(ASTER_HREF, with_nodata=True)
+    assert footprint_from_href(tmp_href) == expected
+    assert footprint_from_href(tmp_href, bands=[]) == expected
+
+
+def test_convex_hull_read_in_strips(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(footprint_module, "_STRIP_PIXELS", 1)
+    with rasterio.open(ASTER_HREF) as reader:
+        mask = np.bitwise_or.reduce(reader.read_masks([1, 2, 3]))
+        expected = footprint_from_mask(
+            mask, reader.transform, reader.crs, convex_hull=True
+        )
+        footprint = footprint_from_rasterio_reader(
+            reader, bands=[1, 2, 3], convex_hull=True
+        )
+    assert footprint == expected
@@ -1,12 +1,16 @@
 import numpy as np
 import numpy.typing as npt
 import pytest
+import rasterio.features
 from raster_footprint import create_mask
+from raster_footprint import mask as mask_module
 from raster_footprint.mask import get_mask_geometry
 from rasterio import Affine
-from shapely.geometry import shape
+from shapely import unary_union
+from shapely.geometry import MultiPolygon, Polygon, shape
+from shapely.geometry.polygon import orient
 
-from .conftest import read_geojson
+from .conftest import read_geometry
 
 TRANSFORM = Affine(1, 0, 0, 0, -1, 0)
 
@@ -88,26 +92,54 @@ def test_create_mask_3d_array() -> None:
     assert np.array_equal(mask, expected)
 
 
+def test_create_mask_many_bands() -> None:
+    array = np.ones((256, 5, 5))
+    array[:, 2, 2] = 0
+    mask = create_mask(array, nodata=0)
+    expected = np.ones((5, 5), dtype=np.uint8) * 255
+    expected[2, 2] = 0
+    assert np.array_equal(mask, expected)
+
+
+def test_create_mask_in_tiles(monkeypatch: pytest.MonkeyPatch) -> None:
+    array = np.zeros((3, 7, 5), dtype=np.int16)
+    array[0, 1, 1] = 1
+    array[1, 4, 2] = 1
+    array[2, 6, 4] = 1
+    expected = create_mask(array, nodata=0)
+    monkeypatch.setattr(mask_module, "_TILE_PIXELS", 10)
+    assert np.array_equal(create_mask(array, nodata=0), expected)
+    assert np.count_nonzero(expected) == 3
+
+
+def test_create_mask_nodata_out_of_dtype_range() -> None:
+    expected = np.ones((5, 5), dtype=np.uint8) * 255
+    array = np.zeros((2, 5, 5), dtype=np.uint8)
+    for nodata in [-9999, 256, 0.5, np.nan]:
+        mask = create_mask(array, nodata=nodata)
+        assert np.array_equal(mask, expected)
+
+
 def test_geometry_concave_shell(concave_shell: npt.NDArray[np.uint8]) -> None:
     geometry = get_mask_geometry(concave_shell, transform=TRANSFORM)
-    expected = read_geojson("concave-shell")
-    assert shape(geometry).normalize() == shape(expected).normalize()
+    expected = read_geometry("concave-shell")
+    assert shape(geometry).normalize() == expected.normalize()
 
 
 def test_geometry_convex_hull_of_concave_shell(
     concave_shell: npt.NDArray[np.uint8],
 ) -> None:
     geometry = get_mask_geometry(concave_shell, transform=TRANSFORM, convex_hull=True)
-    expected = read_geojson("convex-hull-of-concave-shell")
-    assert shape(geometry).normalize() == shape(expected).normalize()
+    expected = read_geometry("convex-hull-of-concave-shell")
+    assert shape(geometry).normalize() == expected.normalize()
 
 
 def test_geometry_two_concave_shells(
     two_concave_shells: npt.NDArray[np.uint8],
 ) -> None:
     geometry = get_mask_geometry(two_concave_shells, transform=TRANSFORM)
-    expected = read_geojson("two-concave-shells")
-    assert shape(geometry).normalize() == shape(expected).normalize()
+    expected = read_geometry("two-concave-shells")
+    assert shape(geometry).normalize() == expected.normalize()
 
 
 def test_geometry_convex_hull_of_two_concave_shells(
@@ -116,8 +148,8 @@ def test_geometry_convex_hull_of_two_concave_shells(
     geometry = get_mask_geometry(
         two_concave_shells, transform=TRANSFORM, convex_hull=True
     )
-    expected = read_geojson("convex-hull-of-two-concave-shells")
-    assert shape(geometry).normalize() == shape(expected).normalize()
+    expected = read_geometry("convex-hull-of-two-concave-shells")
+    assert shape(geometry).normalize() == expected.normalize()
 
 
 def test_geometry_two_concave_shells_with_holes(
@@ -126,8 +158,8 @@ def test_geometry_two_concave_shells_with_holes(
     geometry = get_mask_geometry(
         two_concave_shells_with_holes, transform=TRANSFORM, holes=True
     )
-    expected = read_geojson("two-concave-shells-with-holes")
-    assert shape(geometry).normalize() == shape(expected).normalize()
+    expected = read_geometry("two-concave-shells-with-holes")
+    assert shape(geometry).normalize() == expected.normalize()
 
 
 def test_geometry_convex_hull_of_two_concave_shells_with_holes(
@@ -136,13 +168,90 @@ def test_geometry_convex_hull_of_two_concave_shells_with_holes(
     geometry = get_mask_geometry(
         two_concave_shells_with_holes, transform=TRANSFORM, convex_hull=True
     )
-    expected = read_geojson("convex-hull-of-two-concave-shells")
-    assert shape(geometry).normalize() == shape(expected).normalize()
+    expected = read_geometry("convex-hull-of-two-concave-shells")
+    assert shape(geometry).normalize() == expected.normalize()
 
 
 def test_geometry_two_concave_shells_with_holes_filled(
     two_concave_shells_with_holes: npt.NDArray[np.uint8],
 ) -> None:
     geometry = get_mask_geometry(two_concave_shells_with_holes, transform=TRANSFORM)
-    expected = read_geojson("two-concave-shells")
-    assert shape(geometry).normalize() == shape(expected).normalize()
+    expected = read_geometry("two-concave-shells")
+    assert shape(geometry).normalize() == expected.normalize()
+
+
+def test_geometry_island_in_hole_filled() -> None:
+    mask = np.zeros((9, 12), dtype=np.uint8)
+    mask[1:8, 1:8] = 255
+    mask[2:7, 2:7] = 0
+    mask[4, 4] = 255  # island inside the hole
+    mask[8, 8:11] = 255  # region touching the shell at a corner
+    shells = [
+        shape({"type": "Polygon", "coordinates": polygon_dict["coordinates"][:1]})
+        for polygon_dict, _ in rasterio.features.shapes(
+            mask, mask=mask == 255, transform=TRANSFORM
+        )
+    ]
+    expected = unary_union(shells)
+    assert isinstance(expected, MultiPolygon) and len(expected.geoms) == 2
+
+    geometry = get_mask_geometry(mask, transform=TRANSFORM)
+    assert geometry is not None and geometry.is_valid
+    assert geometry.normalize() == expected.normalize()
+
+
+@pytest.mark.parametrize("convex_hull", [False, True])
+@pytest.mark.parametrize(
+    "transform", [TRANSFORM, Affine(1, 0, 0, 0, 1, 0), Affine(2, 0.5, 10, 0.25, -3, 20)]
+)
+def test_geometry_full_mask_matches_polygonized_extent(
+    transform: Affine, convex_hull: bool
+) -> None:
+    mask = np.full((4, 6), 255, dtype=np.uint8)
+    (polygon_dict, _), *_ = rasterio.features.shapes(mask, transform=transform)
+    expected = orient(shape(polygon_dict))
+    if convex_hull:
+        expected = orient(expected.convex_hull)
+    geometry = get_mask_geometry(mask, transform=transform, convex_hull=convex_hull)
+    assert geometry is not None
+    assert geometry.equals_exact(expected, 0)
+
+
+def test_geometry_downsample(concave_shell: npt.NDArray[np.uint8]) -> None:
+    geometry = get_mask_geometry(concave_shell, transform=TRANSFORM, downsample=3)
+    assert geometry is not None
+    assert geometry.covers(get_mask_geometry(concave_shell, transform=TRANSFORM))
+    # the 6x6 valid block at rows/cols 1-6 covers all three 3x3 blocks
+    assert (
+        geometry.normalize() == Polygon([(0, 0), (9, 0), (9, -9), (0, -9)]).normalize()
+    )
+    with pytest.raises(ValueError):
+        get_mask_geometry(concave_shell, downsample=0)
+
+
+def test_geometry_downsample_3d_mask() -> None:
+    mask = np.full((1, 6, 6), 255, dtype=np.uint8)
+    mask[0, 2, 3] = 0
+    geometry = get_mask_geometry(mask, transform=TRANSFORM, downsample=2)
+    assert geometry == get_mask_geometry(mask[0], transform=TRANSFORM, downsample=2)
+    assert geometry is not None
+    assert (
+        geometry.normalize() == Polygon([(0, 0), (6, 0), (6, -6), (0, -6)]).normalize()
+    )
+
+
+@pytest.mark.parametrize("transform", [TRANSFORM, Affine(0.3, -0.2, 10, 0.2, 0.3, 20)])
+def test_geometry_convex_hull_matches_polygonized_hull(transform: Affine) -> None:
+    rng = np.random.default_rng(0)
+    mask = np.where(rng.random((40, 30)) < 0.3, 255, 0).astype(np.uint8)
+    polygons = [
+        shape(polygon_dict)
+        for polygon_dict, _ in rasterio.features.shapes(
+            mask, mask=mask == 255, transform=transform
+        )
+    ]
+    expected = orient(MultiPolygon(polygons).convex_hull)
+    geometry = get_mask_geometry(mask, transform=transform, convex_hull=True)
+    assert geometry is not None
+    assert geometry.equals_exact(expected, 0)
+    assert get_mask_geometry(np.zeros_like(mask), convex_hull=True) is None
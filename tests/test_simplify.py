@@ -1,30 +1,29 @@
 from raster_footprint import simplify_geometry
-from shapely.geometry import shape
 
-from .conftest import check_winding, read_geojson
+from .conftest import check_winding, read_geometry
 
 
 def test_simplify_polygon() -> None:
-    polygon = shape(read_geojson("concave-shell.json"))
+    polygon = read_geometry("concave-shell.json")
     assert len(polygon.exterior.coords) == 13
     simplified = simplify_geometry(polygon, tolerance=1.1)
-    expected = shape(read_geojson("convex-hull-of-concave-shell.json"))
+    expected = read_geometry("convex-hull-of-concave-shell.json")
     check_winding(simplified)
     assert simplified.normalize() == expected.normalize()
 
 
 def test_simplify_polygon_with_holes() -> None:
-    polygon = shape(read_geojson("concave-shell-with-two-holes.json"))
+    polygon = read_geometry("concave-shell-with-two-holes.json")
 
     # small tolerance retains holes
     simplified = simplify_geometry(polygon, tolerance=0.8)
-    expected = shape(read_geojson("concave-shell-with-two-holes-simplified_0.8.json"))
+    expected = read_geometry("concave-shell-with-two-holes-simplified_0.8.json")
     check_winding(simplified)
     assert simplified.normalize() == expected.normalize()
 
     # large tolerance removes holes
     simplified = simplify_geometry(polygon, tolerance=1.1)
-    expected = shape(read_geojson("convex-hull-of-concave-shell.json"))
+    expected = read_geometry("convex-hull-of-concave-shell.json")
     check_winding(simplified)
     assert simplified.normalize() == expected.normalize()
 
@@ -34,20 +33,20 @@ def test_simplify_polygon_with_holes() -> None:
 
 
 def test_simplify_multi_polygon_with_holes() -> None:
-    multi_polygon = shape(read_geojson("two-concave-shells-each-with-two-holes.json"))
+    multi_polygon = read_geometry("two-concave-shells-each-with-two-holes.json")
 
     # small tolerance simplifies shells, retains holes
     simplified = simplify_geometry(multi_polygon, tolerance=0.8)
-    expected = shape(
-        read_geojson("two-concave-shells-each-with-two-holes-simplified_0.8.json")
+    expected = read_geometry(
+        "two-concave-shells-each-with-two-holes-simplified_0.8.json"
     )
     check_winding(simplified)
     assert simplified.normalize() == expected.normalize()
 
     # large tolerance simplifes shells, removes holes
     simplified = simplify_geometry(multi_polygon, tolerance=1.1)
-    expected = shape(
-        read_geojson("two-concave-shells-each-with-two-holes-simplified_1.1.json")
+    expected = read_geometry(
+        "two-concave-shells-each-with-two-holes-simplified_1.1.json"
     )
     check_winding(simplified)
     assert simplified.normalize() == expected.normalize()